@@ -5,36 +5,76 @@ Parses warp benchmark results and creates visualization charts
 """
 
 import os
+import io
+import csv
 import sys
 import re
 import json
-import subprocess
+import functools
+import mmap
 from pathlib import Path
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import matplotlib
+matplotlib.use('Agg')  # headless rendering, skip GUI backend probing
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
+import pandas as pd
+import zstandard as zstd
 
+# Shared decompressor - stateless, so one instance serves all files
+_DCTX = zstd.ZstdDecompressor()
+
+# Precompiled patterns - these run once per log file, so compile at import
+# instead of paying the re cache lookup on every call. The log patterns are
+# bytes so they can scan a memory-mapped file without decoding it first.
+_SIZE_RE = re.compile(r'(\d+(?:\.\d+)?)(KiB|MiB|GiB|KB|MB|GB)?')
+_AVG_RE = re.compile(
+    rb'\*\s*Average:\s+([\d.]+)\s+(MiB/s|KiB/s|GiB/s),\s+([\d.]+)\s+obj/s',
+    re.IGNORECASE)
+_LATENCY_RE = re.compile(rb'Reqs:\s+Avg:\s+([\d.]+)ms,.*?99%:\s+([\d.]+)ms', re.IGNORECASE)
+_ERR_RE = re.compile(rb'Errs:\s*(\d+)')
+_TOTAL_RE = re.compile(rb'Reqs:\s*(\d+),\s*Errs:')
+_FNAME_RE = re.compile(r'put_(.+)_c(\d+)')
+
+# Below this many log files the process pool spawn overhead outweighs the win
+_PARALLEL_THRESHOLD = 32
+
+# The warp summary (Report/Average/Reqs/Errs) sits in the last ~100 lines of
+# a run log, so only this much of the tail needs scanning on large files
+_TAIL_BYTES = 64 * 1024
+
+# Beyond this many heatmap cells the per-cell Text artists dominate render
+# time and the labels are unreadable anyway
+_MAX_ANNOTATED_CELLS = 400
+
+# Shared savefig settings: dpi=100 is plenty for screen viewing, skipping
+# bbox_inches='tight' avoids a second full render pass (tight_layout is
+# already applied before saving), and a light PNG compression level trades
+# a few KB of file size for a much faster encode
+_SAVE_KW = dict(dpi=100, pil_kwargs={'compress_level': 1})
+
+_SIZE_MULTIPLIERS = {
+    'B': 1,
+    'KiB': 1024,
+    'MiB': 1024**2,
+    'GiB': 1024**3,
+    'KB': 1000,
+    'MB': 1000**2,
+    'GB': 1000**3,
+}
+
+@functools.lru_cache(maxsize=None)
 def parse_size(size_str):
     """Convert size string (e.g., '4MiB', '256KiB') to bytes"""
-    match = re.match(r'(\d+(?:\.\d+)?)(KiB|MiB|GiB|KB|MB|GB)?', size_str)
+    match = _SIZE_RE.match(size_str)
     if not match:
         return 0
-    
+
     value = float(match.group(1))
     unit = match.group(2) or 'B'
-    
-    multipliers = {
-        'B': 1,
-        'KiB': 1024,
-        'MiB': 1024**2,
-        'GiB': 1024**3,
-        'KB': 1000,
-        'MB': 1000**2,
-        'GB': 1000**3,
-    }
-    
-    return int(value * multipliers.get(unit, 1))
+
+    return int(value * _SIZE_MULTIPLIERS.get(unit, 1))
 
 def format_size(bytes_val):
     """Format bytes to human readable"""
@@ -53,21 +93,10 @@ def format_throughput(mbps):
 def decompress_and_parse_warp_output(zst_file):
     """Decompress .csv.zst file and extract summary statistics"""
     try:
-        # Decompress using zstd
-        result = subprocess.run(
-            ['zstd', '-d', '--stdout', str(zst_file)],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        csv_content = result.stdout
-        lines = csv_content.strip().split('\n')
-        
         # Parse CSV header and data
         # Warp typically outputs: operation,objects,bytes,duration,throughput_mb/s,ops/s,errors
         # We'll look for summary statistics in the output
-        
+
         data = {
             'throughput_mbps': 0,
             'ops_per_sec': 0,
@@ -76,38 +105,42 @@ def decompress_and_parse_warp_output(zst_file):
             'errors': 0,
             'total_ops': 0
         }
-        
-        for line in lines:
-            if not line or line.startswith('#'):
-                continue
-            
-            # Look for summary or aggregated statistics
-            parts = line.split(',')
-            if len(parts) >= 6:
+
+        # Decompress in-process and stream lines straight into the csv reader
+        with open(zst_file, 'rb') as fh:
+            reader = _DCTX.stream_reader(fh)
+            text = io.TextIOWrapper(reader, encoding='utf-8', newline='')
+
+            for parts in csv.reader(text):
+                if not parts or parts[0].startswith('#'):
+                    continue
+
+                # Look for summary or aggregated statistics: the operation
+                # is the first column, so check it directly instead of
+                # substring-searching the whole reassembled line
+                if len(parts) < 6 or parts[0].upper() not in ('PUT', 'GET'):
+                    continue
+
                 try:
-                    # Try to extract throughput and ops/s
-                    # Format may vary, this is a common pattern
-                    if 'PUT' in line.upper() or 'GET' in line.upper():
-                        throughput = float(parts[4]) if len(parts) > 4 else 0
-                        ops_sec = float(parts[5]) if len(parts) > 5 else 0
-                        
-                        data['throughput_mbps'] = max(data['throughput_mbps'], throughput)
-                        data['ops_per_sec'] = max(data['ops_per_sec'], ops_sec)
-                        
-                        if len(parts) > 6:
-                            errors = int(parts[6])
-                            data['errors'] += errors
-                except (ValueError, IndexError):
+                    throughput = float(parts[4])
+                    ops_sec = float(parts[5])
+                except ValueError:
                     continue
-        
+
+                data['throughput_mbps'] = max(data['throughput_mbps'], throughput)
+                data['ops_per_sec'] = max(data['ops_per_sec'], ops_sec)
+
+                if len(parts) > 6:
+                    try:
+                        data['errors'] += int(parts[6])
+                    except ValueError:
+                        pass
+
         return data
-        
-    except subprocess.CalledProcessError as e:
+
+    except (zstd.ZstdError, OSError) as e:
         print(f"Error decompressing {zst_file}: {e}")
         return None
-    except FileNotFoundError:
-        print("Error: zstd not found. Please install it: brew install zstd")
-        return None
 
 def parse_warp_log(log_file):
     """Parse the warp log file for summary statistics"""
@@ -122,47 +155,74 @@ def parse_warp_log(log_file):
     }
     
     try:
-        with open(log_file, 'r') as f:
-            content = f.read()
-            
-            # Look for the Report line with average throughput
-            # Format: "Report: PUT. Concurrency: X. Ran: Ys"
-            # Next line: " * Average: X.XX MiB/s, XX.XX obj/s"
-            report_match = re.search(r'Report:.*?\n\s*\*\s*Average:\s+([\d.]+)\s+(MiB/s|KiB/s|GiB/s),\s+([\d.]+)\s+obj/s', content, re.IGNORECASE)
-            if report_match:
-                val = float(report_match.group(1))
-                unit = report_match.group(2)
-                ops = float(report_match.group(3))
-                
-                # Convert to MB/s (MiB/s)
-                if 'KiB' in unit or 'KB' in unit:
-                    val /= 1024
-                elif 'GiB' in unit or 'GB' in unit:
-                    val *= 1024
-                
-                data['throughput_mbps'] = val
-                data['ops_per_sec'] = ops
-            
-            # Look for latency information
-            # Format: " * Reqs: Avg: XX.Xms, 50%: XX.Xms, 90%: XX.Xms, 99%: XX.Xms..."
-            latency_match = re.search(r'Reqs:\s+Avg:\s+([\d.]+)ms,.*?99%:\s+([\d.]+)ms', content, re.IGNORECASE)
-            if latency_match:
-                data['avg_latency_ms'] = float(latency_match.group(1))
-                data['p99_latency_ms'] = float(latency_match.group(2))
-            
-            # Look for errors in the final report
-            # Format: "Reqs: 1796, Errs:0, Objs:1796"
-            error_match = re.search(r'Errs:\s*(\d+)', content)
-            if error_match:
-                data['errors'] = int(error_match.group(1))
-                if data['errors'] > 0:
-                    data['success'] = False
-            
-            # Total operations from Reqs line
-            total_match = re.search(r'Reqs:\s*(\d+),\s*Errs:', content)
-            if total_match:
-                data['total_ops'] = int(total_match.group(1))
-                
+        with open(log_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return data
+
+            # Memory-map the file so regexes scan the raw bytes in place -
+            # no eager decode, no full in-memory copy. Cheap substring checks
+            # decide which (if any) regex applies, so most lines never reach one
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The summary lives at the end of the log - skip straight to
+                # the tail on large files and drop the partial first line
+                if len(mm) > _TAIL_BYTES:
+                    mm.seek(len(mm) - _TAIL_BYTES)
+                    mm.readline()
+
+                expect_avg = False
+                found_avg = found_latency = found_errs = False
+                for line in iter(mm.readline, b''):
+                    # Look for the Report line with average throughput
+                    # Format: "Report: PUT. Concurrency: X. Ran: Ys"
+                    # Next line: " * Average: X.XX MiB/s, XX.XX obj/s"
+                    if expect_avg:
+                        expect_avg = False
+                        report_match = _AVG_RE.search(line)
+                        if report_match:
+                            val = float(report_match.group(1))
+                            unit = report_match.group(2)
+                            ops = float(report_match.group(3))
+
+                            # Convert to MB/s (MiB/s)
+                            if b'KiB' in unit or b'KB' in unit:
+                                val /= 1024
+                            elif b'GiB' in unit or b'GB' in unit:
+                                val *= 1024
+
+                            data['throughput_mbps'] = val
+                            data['ops_per_sec'] = ops
+                            found_avg = True
+                            continue
+
+                    if line.startswith(b'Report:'):
+                        expect_avg = True
+                    elif b'Reqs:' in line:
+                        if b'Avg:' in line:
+                            # Latency information
+                            # Format: " * Reqs: Avg: XX.Xms, 50%: XX.Xms, 90%: XX.Xms, 99%: XX.Xms..."
+                            latency_match = _LATENCY_RE.search(line)
+                            if latency_match:
+                                data['avg_latency_ms'] = float(latency_match.group(1))
+                                data['p99_latency_ms'] = float(latency_match.group(2))
+                                found_latency = True
+                        elif b'Errs:' in line:
+                            # Errors and total operations in the final report
+                            # Format: "Reqs: 1796, Errs:0, Objs:1796"
+                            error_match = _ERR_RE.search(line)
+                            if error_match:
+                                data['errors'] = int(error_match.group(1))
+                                if data['errors'] > 0:
+                                    data['success'] = False
+
+                            total_match = _TOTAL_RE.search(line)
+                            if total_match:
+                                data['total_ops'] = int(total_match.group(1))
+                                found_errs = True
+
+                    # Everything captured - no point scanning further
+                    if found_avg and found_latency and found_errs:
+                        break
+
     except Exception as e:
         print(f"Error parsing {log_file}: {e}")
         data['success'] = False
@@ -173,23 +233,30 @@ def collect_results(results_dir):
     """Collect all test results from the directory"""
     results_path = Path(results_dir)
     results = []
-    
+
     # Pattern: put_<SIZE>_c<CONC>.log
+    log_files = []
+    configs = []
     for log_file in sorted(results_path.glob('put_*.log')):
-        filename = log_file.stem
-        
         # Extract size and concurrency from filename
-        match = re.match(r'put_(.+)_c(\d+)', filename)
+        match = _FNAME_RE.match(log_file.stem)
         if not match:
             continue
-        
-        size_str = match.group(1)
-        concurrency = int(match.group(2))
+
+        log_files.append(log_file)
+        configs.append((match.group(1), int(match.group(2))))
+
+    # Parsing is independent per file - fan out across cores when there are
+    # enough logs to amortize the worker startup
+    if len(log_files) < _PARALLEL_THRESHOLD:
+        parsed = [parse_warp_log(f) for f in log_files]
+    else:
+        with ProcessPoolExecutor() as executor:
+            parsed = list(executor.map(parse_warp_log, log_files, chunksize=8))
+
+    for (size_str, concurrency), data in zip(configs, parsed):
         size_bytes = parse_size(size_str)
-        
-        # Parse the log file
-        data = parse_warp_log(log_file)
-        
+
         results.append({
             'size_str': size_str,
             'size_bytes': size_bytes,
@@ -205,7 +272,37 @@ def collect_results(results_dir):
     
     return results
 
-def create_charts(results, output_dir):
+@functools.lru_cache(maxsize=32)
+def _palette(name, n, start=0.0, stop=1.0):
+    """Resample a colormap to n colors, cached per (name, n) pair"""
+    return plt.get_cmap(name)(np.linspace(start, stop, n))
+
+def build_matrices(results, sizes, concurrencies):
+    """Build size x concurrency matrices of throughput, ops/s and p99 latency"""
+    size_to_idx = {s: i for i, s in enumerate(sizes)}
+    conc_to_idx = {c: i for i, c in enumerate(concurrencies)}
+
+    n = len(results)
+    size_idx = np.fromiter((size_to_idx[r['size_str']] for r in results),
+                           dtype=np.intp, count=n)
+    conc_idx = np.fromiter((conc_to_idx[r['concurrency']] for r in results),
+                           dtype=np.intp, count=n)
+
+    throughput = np.zeros((len(sizes), len(concurrencies)))
+    ops = np.zeros_like(throughput)
+    p99 = np.zeros_like(throughput)
+
+    # One fancy-index scatter per matrix instead of a per-result Python loop
+    throughput[size_idx, conc_idx] = np.fromiter(
+        (r['throughput_mbps'] for r in results), dtype=float, count=n)
+    ops[size_idx, conc_idx] = np.fromiter(
+        (r['ops_per_sec'] for r in results), dtype=float, count=n)
+    p99[size_idx, conc_idx] = np.fromiter(
+        (r['p99_latency_ms'] for r in results), dtype=float, count=n)
+
+    return throughput, ops, p99
+
+def create_charts(results, df, output_dir):
     """Create visualization charts"""
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
@@ -214,41 +311,37 @@ def create_charts(results, output_dir):
         print("No results to visualize!")
         return
     
-    # Group results by size and concurrency
-    by_size = defaultdict(list)
-    by_concurrency = defaultdict(list)
-    
-    for r in results:
-        by_size[r['size_str']].append(r)
-        by_concurrency[r['concurrency']].append(r)
-    
     # Sort sizes by bytes
-    sorted_sizes = sorted(by_size.keys(), key=lambda x: parse_size(x))
-    sorted_concurrencies = sorted(by_concurrency.keys())
-    
-    # Create comprehensive charts
-    create_throughput_heatmap(results, sorted_sizes, sorted_concurrencies, output_path)
-    create_throughput_by_size(by_size, sorted_sizes, output_path)
-    create_throughput_by_concurrency(by_concurrency, sorted_concurrencies, output_path)
-    create_ops_by_size(by_size, sorted_sizes, output_path)
-    create_latency_charts(results, sorted_sizes, sorted_concurrencies, output_path)
-    create_optimal_config_chart(results, output_path)
-    
+    sorted_sizes = sorted({r['size_str'] for r in results}, key=parse_size)
+    sorted_concurrencies = sorted({r['concurrency'] for r in results})
+
+    # Build the size x concurrency matrices once; charts index into them
+    throughput, ops, p99 = build_matrices(results, sorted_sizes, sorted_concurrencies)
+
+    # Build every figure first, then write the PNGs in parallel - libpng
+    # releases the GIL while compressing, so the saves overlap on threads
+    charts = [
+        create_throughput_heatmap(throughput, sorted_sizes, sorted_concurrencies, output_path),
+        *create_size_bars(throughput, ops, sorted_sizes, sorted_concurrencies, output_path),
+        create_throughput_by_concurrency(throughput, sorted_sizes, sorted_concurrencies, output_path),
+        create_latency_charts(df, output_path),
+        create_optimal_config_chart(results, output_path),
+    ]
+    charts = [c for c in charts if c is not None]
+
+    with ThreadPoolExecutor(max_workers=len(charts)) as executor:
+        list(executor.map(lambda chart: chart[0].savefig(chart[1], **_SAVE_KW), charts))
+
+    plt.close('all')
+
     print(f"\n✓ Charts saved to: {output_path}")
 
-def create_throughput_heatmap(results, sizes, concurrencies, output_path):
+def create_throughput_heatmap(matrix, sizes, concurrencies, output_path):
     """Create heatmap showing throughput across all combinations"""
     fig, ax = plt.subplots(figsize=(14, 8))
-    
-    # Create matrix
-    matrix = np.zeros((len(sizes), len(concurrencies)))
-    
-    for r in results:
-        size_idx = sizes.index(r['size_str'])
-        conc_idx = concurrencies.index(r['concurrency'])
-        matrix[size_idx, conc_idx] = r['throughput_mbps']
-    
-    im = ax.imshow(matrix, aspect='auto', cmap='RdYlGn', interpolation='nearest')
+
+    im = ax.imshow(matrix, aspect='auto', cmap='RdYlGn', interpolation='nearest',
+                   rasterized=True)
     
     # Labels
     ax.set_xticks(range(len(concurrencies)))
@@ -260,82 +353,75 @@ def create_throughput_heatmap(results, sizes, concurrencies, output_path):
     ax.set_title('S3 Throughput Heatmap (MB/s)', fontsize=14, fontweight='bold')
     
     # Add colorbar
-    cbar = plt.colorbar(im, ax=ax)
+    cbar = fig.colorbar(im, ax=ax)
     cbar.set_label('Throughput (MB/s)', fontsize=10)
     
-    # Add values to cells
-    for i in range(len(sizes)):
-        for j in range(len(concurrencies)):
-            value = matrix[i, j]
-            if value > 0:
-                text = ax.text(j, i, f'{value:.0f}',
-                             ha="center", va="center", color="black", fontsize=8)
+    # Add values to cells, unless the grid is too dense for them to matter
+    if matrix.size <= _MAX_ANNOTATED_CELLS:
+        labels = np.where(matrix > 0, np.char.mod('%.0f', matrix), '')
+        fontdict = {'ha': 'center', 'va': 'center', 'color': 'black', 'fontsize': 8}
+        for (i, j), label in np.ndenumerate(labels):
+            if label:
+                ax.text(j, i, label, fontdict=fontdict)
     
-    plt.tight_layout()
-    plt.savefig(output_path / 'throughput_heatmap.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    return fig, output_path / 'throughput_heatmap.png'
+
+def create_size_bars(throughput, ops, sizes, conc_levels, output_path):
+    """Grouped bar charts over object size: throughput and ops/s share the prep"""
+    if len(conc_levels) < 2:
+        print("  Skipping per-size bar charts (only one concurrency level tested)")
+        return []
 
-def create_throughput_by_size(by_size, sizes, output_path):
-    """Bar chart: throughput vs object size for different concurrency levels"""
-    fig, ax = plt.subplots(figsize=(14, 8))
-    
-    # Get all concurrency levels
-    all_conc = set()
-    for size_results in by_size.values():
-        for r in size_results:
-            all_conc.add(r['concurrency'])
-    
-    conc_levels = sorted(all_conc)
     x = np.arange(len(sizes))
     width = 0.8 / len(conc_levels)
-    
-    colors = plt.cm.viridis(np.linspace(0, 1, len(conc_levels)))
-    
-    for idx, conc in enumerate(conc_levels):
-        throughputs = []
-        for size in sizes:
-            size_results = by_size[size]
-            conc_result = next((r for r in size_results if r['concurrency'] == conc), None)
-            throughputs.append(conc_result['throughput_mbps'] if conc_result else 0)
-        
-        ax.bar(x + idx * width, throughputs, width, label=f'C={conc}', color=colors[idx])
-    
-    ax.set_xlabel('Object Size', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Throughput (MB/s)', fontsize=12, fontweight='bold')
-    ax.set_title('Throughput by Object Size (Different Concurrency Levels)', fontsize=14, fontweight='bold')
-    ax.set_xticks(x + width * (len(conc_levels) - 1) / 2)
-    ax.set_xticklabels(sizes, rotation=45, ha='right')
-    ax.legend(title='Concurrency', bbox_to_anchor=(1.05, 1), loc='upper left')
-    ax.grid(axis='y', alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig(output_path / 'throughput_by_size.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    tick_pos = x + width * (len(conc_levels) - 1) / 2
+
+    specs = [
+        (throughput, 'viridis', 'Throughput (MB/s)',
+         'Throughput by Object Size (Different Concurrency Levels)',
+         'throughput_by_size.png'),
+        (ops, 'coolwarm', 'Operations per Second',
+         'Operations per Second by Object Size',
+         'ops_by_size.png'),
+    ]
+
+    charts = []
+    for matrix, cmap, ylabel, title, filename in specs:
+        fig, ax = plt.subplots(figsize=(14, 8))
+        colors = _palette(cmap, len(conc_levels))
+
+        for idx, conc in enumerate(conc_levels):
+            ax.bar(x + idx * width, matrix[:, idx], width, label=f'C={conc}', color=colors[idx])
+
+        ax.set_xlabel('Object Size', fontsize=12, fontweight='bold')
+        ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_xticks(tick_pos)
+        ax.set_xticklabels(sizes, rotation=45, ha='right')
+        ax.legend(title='Concurrency', bbox_to_anchor=(1.05, 1), loc='upper left')
+        ax.grid(axis='y', alpha=0.3)
+
+        fig.tight_layout()
+        charts.append((fig, output_path / filename))
 
-def create_throughput_by_concurrency(by_concurrency, concurrencies, output_path):
+    return charts
+
+def create_throughput_by_concurrency(throughput, sizes, concurrencies, output_path):
     """Bar chart: throughput vs concurrency for different object sizes"""
+    if len(sizes) < 2:
+        print("  Skipping throughput-by-concurrency chart (only one object size tested)")
+        return None
+
     fig, ax = plt.subplots(figsize=(14, 8))
-    
-    # Get all sizes
-    all_sizes = set()
-    for conc_results in by_concurrency.values():
-        for r in conc_results:
-            all_sizes.add(r['size_str'])
-    
-    sizes = sorted(all_sizes, key=parse_size)
+
     x = np.arange(len(concurrencies))
     width = 0.8 / len(sizes)
-    
-    colors = plt.cm.plasma(np.linspace(0, 1, len(sizes)))
-    
+
+    colors = _palette('plasma', len(sizes))
+
     for idx, size in enumerate(sizes):
-        throughputs = []
-        for conc in concurrencies:
-            conc_results = by_concurrency[conc]
-            size_result = next((r for r in conc_results if r['size_str'] == size), None)
-            throughputs.append(size_result['throughput_mbps'] if size_result else 0)
-        
-        ax.bar(x + idx * width, throughputs, width, label=size, color=colors[idx])
+        ax.bar(x + idx * width, throughput[idx, :], width, label=size, color=colors[idx])
     
     ax.set_xlabel('Concurrency Level', fontsize=12, fontweight='bold')
     ax.set_ylabel('Throughput (MB/s)', fontsize=12, fontweight='bold')
@@ -345,83 +431,38 @@ def create_throughput_by_concurrency(by_concurrency, concurrencies, output_path)
     ax.legend(title='Object Size', bbox_to_anchor=(1.05, 1), loc='upper left')
     ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(output_path / 'throughput_by_concurrency.png', dpi=150, bbox_inches='tight')
-    plt.close()
-
-def create_ops_by_size(by_size, sizes, output_path):
-    """Bar chart: operations per second"""
-    fig, ax = plt.subplots(figsize=(14, 8))
-    
-    all_conc = set()
-    for size_results in by_size.values():
-        for r in size_results:
-            all_conc.add(r['concurrency'])
-    
-    conc_levels = sorted(all_conc)
-    x = np.arange(len(sizes))
-    width = 0.8 / len(conc_levels)
-    
-    colors = plt.cm.coolwarm(np.linspace(0, 1, len(conc_levels)))
-    
-    for idx, conc in enumerate(conc_levels):
-        ops = []
-        for size in sizes:
-            size_results = by_size[size]
-            conc_result = next((r for r in size_results if r['concurrency'] == conc), None)
-            ops.append(conc_result['ops_per_sec'] if conc_result else 0)
-        
-        ax.bar(x + idx * width, ops, width, label=f'C={conc}', color=colors[idx])
-    
-    ax.set_xlabel('Object Size', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Operations per Second', fontsize=12, fontweight='bold')
-    ax.set_title('Operations per Second by Object Size', fontsize=14, fontweight='bold')
-    ax.set_xticks(x + width * (len(conc_levels) - 1) / 2)
-    ax.set_xticklabels(sizes, rotation=45, ha='right')
-    ax.legend(title='Concurrency', bbox_to_anchor=(1.05, 1), loc='upper left')
-    ax.grid(axis='y', alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig(output_path / 'ops_by_size.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    return fig, output_path / 'throughput_by_concurrency.png'
 
-def create_latency_charts(results, sizes, concurrencies, output_path):
+def create_latency_charts(df, output_path):
     """Create latency analysis charts"""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
-    
     # Filter results with valid latency data
-    valid_results = [r for r in results if r['avg_latency_ms'] > 0]
-    
-    if not valid_results:
-        return
-    
-    # Average latency by concurrency
-    by_conc = defaultdict(list)
-    for r in valid_results:
-        by_conc[r['concurrency']].append(r['avg_latency_ms'])
-    
-    conc_sorted = sorted(by_conc.keys())
-    avg_latencies = [np.mean(by_conc[c]) for c in conc_sorted]
-    
-    ax1.bar(range(len(conc_sorted)), avg_latencies, color='steelblue')
+    valid = df[df['avg_latency_ms'] > 0]
+
+    if valid.empty or valid['concurrency'].nunique() < 2:
+        return None
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+
+    # Average latency by concurrency (groupby sorts the keys)
+    avg_latencies = valid.groupby('concurrency')['avg_latency_ms'].mean()
+    conc_sorted = avg_latencies.index.tolist()
+
+    ax1.bar(range(len(conc_sorted)), avg_latencies.to_numpy(), color='steelblue')
     ax1.set_xlabel('Concurrency Level', fontsize=12, fontweight='bold')
     ax1.set_ylabel('Average Latency (ms)', fontsize=12, fontweight='bold')
     ax1.set_title('Average Latency by Concurrency', fontsize=13, fontweight='bold')
     ax1.set_xticks(range(len(conc_sorted)))
     ax1.set_xticklabels(conc_sorted)
     ax1.grid(axis='y', alpha=0.3)
-    
+
     # P99 latency by concurrency
-    p99_results = [r for r in results if r['p99_latency_ms'] > 0]
-    if p99_results:
-        by_conc_p99 = defaultdict(list)
-        for r in p99_results:
-            by_conc_p99[r['concurrency']].append(r['p99_latency_ms'])
-        
-        conc_sorted_p99 = sorted(by_conc_p99.keys())
-        p99_latencies = [np.mean(by_conc_p99[c]) for c in conc_sorted_p99]
-        
-        ax2.bar(range(len(conc_sorted_p99)), p99_latencies, color='coral')
+    p99_valid = df[df['p99_latency_ms'] > 0]
+    if not p99_valid.empty:
+        p99_latencies = p99_valid.groupby('concurrency')['p99_latency_ms'].mean()
+        conc_sorted_p99 = p99_latencies.index.tolist()
+
+        ax2.bar(range(len(conc_sorted_p99)), p99_latencies.to_numpy(), color='coral')
         ax2.set_xlabel('Concurrency Level', fontsize=12, fontweight='bold')
         ax2.set_ylabel('P99 Latency (ms)', fontsize=12, fontweight='bold')
         ax2.set_title('P99 Latency by Concurrency', fontsize=13, fontweight='bold')
@@ -429,23 +470,22 @@ def create_latency_charts(results, sizes, concurrencies, output_path):
         ax2.set_xticklabels(conc_sorted_p99)
         ax2.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(output_path / 'latency_analysis.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    return fig, output_path / 'latency_analysis.png'
 
 def create_optimal_config_chart(results, output_path):
     """Identify and visualize optimal configurations"""
     if not results:
-        return
-    
+        return None
+
     # Find top 10 configurations by throughput
     top_results = sorted(results, key=lambda x: x['throughput_mbps'], reverse=True)[:10]
-    
+
     fig, ax = plt.subplots(figsize=(12, 8))
-    
+
     labels = [f"{r['size_str']}\nC={r['concurrency']}" for r in top_results]
     throughputs = [r['throughput_mbps'] for r in top_results]
-    colors = plt.cm.RdYlGn(np.linspace(0.5, 1, len(top_results)))
+    colors = _palette('RdYlGn', len(top_results), start=0.5)
     
     bars = ax.barh(range(len(labels)), throughputs, color=colors)
     ax.set_yticks(range(len(labels)))
@@ -459,88 +499,86 @@ def create_optimal_config_chart(results, output_path):
         ax.text(val + max(throughputs) * 0.01, i, f'{val:.1f} MB/s', 
                 va='center', fontsize=10, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(output_path / 'optimal_configurations.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    return fig, output_path / 'optimal_configurations.png'
 
-def generate_summary_report(results, output_path):
+def generate_summary_report(df, output_path):
     """Generate text summary report"""
-    if not results:
+    if df.empty:
         return
-    
+
     report_path = output_path / 'performance_summary.txt'
-    
+
+    # Assemble the report in memory and write it in one go
+    parts = []
+    parts.append("=" * 80 + "\n")
+    parts.append("S3 WARP PERFORMANCE TEST SUMMARY\n")
+    parts.append("=" * 80 + "\n\n")
+
+    parts.append(f"Total tests: {len(df)}\n")
+    successful = int(df['success'].sum())
+    failed = len(df) - successful
+    parts.append(f"Successful: {successful}\n")
+    parts.append(f"Failed: {failed}\n\n")
+
+    # Best overall
+    best = df.loc[df['throughput_mbps'].idxmax()]
+    parts.append("BEST OVERALL CONFIGURATION:\n")
+    parts.append("-" * 80 + "\n")
+    parts.append(f"Object Size: {best['size_str']}\n")
+    parts.append(f"Concurrency: {best['concurrency']}\n")
+    parts.append(f"Throughput: {best['throughput_mbps']:.2f} MB/s\n")
+    parts.append(f"Operations/sec: {best['ops_per_sec']:.2f}\n")
+    if best['avg_latency_ms'] > 0:
+        parts.append(f"Avg Latency: {best['avg_latency_ms']:.2f} ms\n")
+    parts.append("\n")
+
+    # Best by object size
+    parts.append("BEST CONFIGURATION BY OBJECT SIZE:\n")
+    parts.append("-" * 80 + "\n")
+    best_by_size = df.loc[df.groupby('size_str')['throughput_mbps'].idxmax()]
+    best_by_size = best_by_size.sort_values('size_bytes')
+
+    for row in best_by_size.itertuples():
+        parts.append(f"{row.size_str:>10s}: C={row.concurrency:<6d} "
+                     f"→ {row.throughput_mbps:>8.2f} MB/s "
+                     f"({row.ops_per_sec:.0f} ops/s)\n")
+    parts.append("\n")
+
+    # Performance breakdown analysis
+    parts.append("PERFORMANCE BREAKDOWN ANALYSIS:\n")
+    parts.append("-" * 80 + "\n")
+
+    # Find where performance starts to degrade
+    conc_avg = df.groupby('concurrency')['throughput_mbps'].mean()
+
+    peak_conc = conc_avg.idxmax()
+    peak_throughput = conc_avg.max()
+
+    parts.append(f"Peak average throughput at concurrency: {peak_conc}\n")
+    parts.append(f"Peak average throughput: {peak_throughput:.2f} MB/s\n\n")
+
+    # Identify breakdown point (where throughput drops > 20%)
+    breakdown_threshold = 0.8
+    prev_avg = conc_avg.shift()
+    dropped = conc_avg[conc_avg < prev_avg * breakdown_threshold]
+    if not dropped.empty:
+        conc = dropped.index[0]
+        prev = prev_avg[conc]
+        parts.append(f"⚠ Performance degradation detected at concurrency: {conc}\n")
+        parts.append(f"  Throughput dropped to {conc_avg[conc]:.2f} MB/s "
+                     f"(from {prev:.2f} MB/s)\n\n")
+
+    parts.append("=" * 80 + "\n")
+
+    report = ''.join(parts)
     with open(report_path, 'w') as f:
-        f.write("=" * 80 + "\n")
-        f.write("S3 WARP PERFORMANCE TEST SUMMARY\n")
-        f.write("=" * 80 + "\n\n")
-        
-        f.write(f"Total tests: {len(results)}\n")
-        successful = sum(1 for r in results if r['success'])
-        failed = len(results) - successful
-        f.write(f"Successful: {successful}\n")
-        f.write(f"Failed: {failed}\n\n")
-        
-        # Best overall
-        best = max(results, key=lambda x: x['throughput_mbps'])
-        f.write("BEST OVERALL CONFIGURATION:\n")
-        f.write("-" * 80 + "\n")
-        f.write(f"Object Size: {best['size_str']}\n")
-        f.write(f"Concurrency: {best['concurrency']}\n")
-        f.write(f"Throughput: {best['throughput_mbps']:.2f} MB/s\n")
-        f.write(f"Operations/sec: {best['ops_per_sec']:.2f}\n")
-        if best['avg_latency_ms'] > 0:
-            f.write(f"Avg Latency: {best['avg_latency_ms']:.2f} ms\n")
-        f.write("\n")
-        
-        # Best by object size
-        f.write("BEST CONFIGURATION BY OBJECT SIZE:\n")
-        f.write("-" * 80 + "\n")
-        by_size = defaultdict(list)
-        for r in results:
-            by_size[r['size_str']].append(r)
-        
-        for size in sorted(by_size.keys(), key=parse_size):
-            best_for_size = max(by_size[size], key=lambda x: x['throughput_mbps'])
-            f.write(f"{size:>10s}: C={best_for_size['concurrency']:<6d} "
-                   f"→ {best_for_size['throughput_mbps']:>8.2f} MB/s "
-                   f"({best_for_size['ops_per_sec']:.0f} ops/s)\n")
-        f.write("\n")
-        
-        # Performance breakdown analysis
-        f.write("PERFORMANCE BREAKDOWN ANALYSIS:\n")
-        f.write("-" * 80 + "\n")
-        
-        # Find where performance starts to degrade
-        by_concurrency = defaultdict(list)
-        for r in results:
-            by_concurrency[r['concurrency']].append(r['throughput_mbps'])
-        
-        conc_avg = {c: np.mean(vals) for c, vals in by_concurrency.items()}
-        sorted_conc = sorted(conc_avg.keys())
-        
-        peak_conc = max(conc_avg, key=conc_avg.get)
-        peak_throughput = conc_avg[peak_conc]
-        
-        f.write(f"Peak average throughput at concurrency: {peak_conc}\n")
-        f.write(f"Peak average throughput: {peak_throughput:.2f} MB/s\n\n")
-        
-        # Identify breakdown point (where throughput drops > 20%)
-        breakdown_threshold = 0.8
-        for i, conc in enumerate(sorted_conc):
-            if i > 0 and conc_avg[conc] < conc_avg[sorted_conc[i-1]] * breakdown_threshold:
-                f.write(f"⚠ Performance degradation detected at concurrency: {conc}\n")
-                f.write(f"  Throughput dropped to {conc_avg[conc]:.2f} MB/s "
-                       f"(from {conc_avg[sorted_conc[i-1]]:.2f} MB/s)\n\n")
-                break
-        
-        f.write("=" * 80 + "\n")
-    
+        f.write(report)
+
     print(f"✓ Summary report saved to: {report_path}")
-    
-    # Print to console
-    with open(report_path, 'r') as f:
-        print("\n" + f.read())
+
+    # Print to console from the buffer already in memory
+    print("\n" + report)
 
 def main():
     if len(sys.argv) < 2:
@@ -565,17 +603,20 @@ def main():
         sys.exit(1)
     
     print(f"Found {len(results)} test results")
-    
+
+    # One tabular view of the results, shared by charts and report
+    df = pd.DataFrame(results)
+
     # Create output directory for charts
     charts_dir = Path(results_dir) / 'charts'
-    
+
     # Generate visualizations
     print("\nGenerating charts...")
-    create_charts(results, charts_dir)
-    
+    create_charts(results, df, charts_dir)
+
     # Generate summary report
     print("\nGenerating summary report...")
-    generate_summary_report(results, charts_dir)
+    generate_summary_report(df, charts_dir)
     
     print("\n" + "=" * 80)
     print("Analysis complete!")